@@ -0,0 +1,62 @@
+"""Shared pytest configuration and fixtures"""
+
+from __future__ import annotations
+
+import functools
+
+import pytest
+
+from naver_dict_api import DictType, NaverDictClient, SearchMode
+
+
+def pytest_collection_modifyitems(config, items):
+    """-m 옵션이 없으면 integration 테스트를 기본 제외"""
+    if config.getoption("-m"):
+        return
+    skip_integration = pytest.mark.skip(
+        reason="integration test (run with -m integration)"
+    )
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
+
+
+@functools.lru_cache(maxsize=None)
+def _cached_client(
+    dict_type=DictType.HANJA,
+    search_mode=SearchMode.SIMPLE,
+    impersonate="chrome136",
+):
+    """설정 조합당 하나의 NaverDictClient 인스턴스를 캐시"""
+    return NaverDictClient(
+        dict_type=dict_type, search_mode=search_mode, impersonate=impersonate
+    )
+
+
+@pytest.fixture
+def client_factory():
+    """설정 조합별로 캐시된 클라이언트를 반환하는 팩토리
+
+    클라이언트는 설정만 들고 있는 무상태 객체이므로 테스트 간 재사용해도
+    안전하다. 단위 테스트의 requests.get은 모듈 수준에서 패치되므로 캐시된
+    인스턴스의 요청도 mock을 경유한다.
+    """
+    return _cached_client
+
+
+@pytest.fixture(scope="class")
+def hanja_client():
+    """통합 테스트에서 공유하는 한자 사전 클라이언트"""
+    return NaverDictClient(dict_type=DictType.HANJA)
+
+
+@pytest.fixture(scope="class")
+def hanja_detailed_client():
+    """통합 테스트에서 공유하는 상세 모드 한자 사전 클라이언트"""
+    return NaverDictClient(dict_type=DictType.HANJA, search_mode=SearchMode.DETAILED)
+
+
+@pytest.fixture(scope="class")
+def english_client():
+    """통합 테스트에서 공유하는 영어 사전 클라이언트"""
+    return NaverDictClient(dict_type=DictType.ENGLISH)
@@ -3,9 +3,10 @@
 from __future__ import annotations
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
+from curl_cffi.requests import RequestsError
 
 from naver_dict_api import (
     DictEntry,
@@ -18,37 +19,68 @@ from naver_dict_api import (
     search_dict,
 )
 
+# 테스트 전반에서 공유하는 mock 응답 페이로드 (테스트마다 재구성하지 않음)
+_HANJA_ITEM = [
+    ["偀"],
+    ["꽃부리 영"],
+    [""],
+    ["꽃부리", "꾸미개", "싹"],
+    ["8c1bd80ffc8042c183e823b2171b1333"],
+    ["ccko"],
+]
+_HANJA_RESPONSE = {"items": [[_HANJA_ITEM]]}
+
+_ENGLISH_ITEM = [
+    ["hello"],
+    ["həˈloʊ"],
+    ["안녕", "여보세요"],
+    [],
+    ["test_id"],
+    ["enko"],
+]
+_ENGLISH_RESPONSE = {"items": [[_ENGLISH_ITEM]]}
+
+
+@pytest.fixture(scope="module")
+def _mock_api_patch():
+    """모듈당 한 번만 requests.get을 패치 (테스트마다 patch 진입/해제 비용 절감)"""
+    with patch("naver_dict_api.client.requests.get") as mock_get:
+        yield mock_get
+
+
+@pytest.fixture
+def mock_api(_mock_api_patch):
+    """테스트마다 호출 기록과 설정을 초기화한 공유 mock을 반환"""
+    _mock_api_patch.reset_mock(return_value=True, side_effect=True)
+    return _mock_api_patch
+
+
+@pytest.fixture
+def sample_entry():
+    """테스트에서 공유하는 DictEntry 샘플"""
+    return DictEntry(
+        word="偀",
+        reading="꽃부리 영",
+        meanings=["꽃부리", "꾸미개", "싹"],
+        entry_id="8c1bd80ffc8042c183e823b2171b1333",
+        dict_type="ccko",
+    )
+
 
 class TestDictEntry:
     """DictEntry 클래스 테스트"""
 
-    def test_dict_entry_creation(self):
+    def test_dict_entry_creation(self, sample_entry):
         """DictEntry 객체 생성 테스트"""
-        entry = DictEntry(
-            word="偀",
-            reading="꽃부리 영",
-            meanings=["꽃부리", "꾸미개", "싹"],
-            entry_id="8c1bd80ffc8042c183e823b2171b1333",
-            dict_type="ccko",
-        )
-
-        assert entry.word == "偀"
-        assert entry.reading == "꽃부리 영"
-        assert entry.meanings == ["꽃부리", "꾸미개", "싹"]
-        assert entry.entry_id == "8c1bd80ffc8042c183e823b2171b1333"
-        assert entry.dict_type == "ccko"
+        assert sample_entry.word == "偀"
+        assert sample_entry.reading == "꽃부리 영"
+        assert sample_entry.meanings == ["꽃부리", "꾸미개", "싹"]
+        assert sample_entry.entry_id == "8c1bd80ffc8042c183e823b2171b1333"
+        assert sample_entry.dict_type == "ccko"
 
-    def test_dict_entry_to_dict(self):
+    def test_dict_entry_to_dict(self, sample_entry):
         """DictEntry.to_dict() 메서드 테스트"""
-        entry = DictEntry(
-            word="偀",
-            reading="꽃부리 영",
-            meanings=["꽃부리", "꾸미개", "싹"],
-            entry_id="8c1bd80ffc8042c183e823b2171b1333",
-            dict_type="ccko",
-        )
-
-        result = entry.to_dict()
+        result = sample_entry.to_dict()
 
         assert isinstance(result, dict)
         assert result["word"] == "偀"
@@ -83,9 +115,9 @@ class TestNaverDictClient:
         assert client.impersonate == "chrome101"
         assert client.base_url == "https://ac-dict.naver.com/enko/ac"
 
-    def test_get_search_params_simple(self):
+    def test_get_search_params_simple(self, client_factory):
         """간단 모드 검색 파라미터 생성 테스트"""
-        client = NaverDictClient(search_mode=SearchMode.SIMPLE)
+        client = client_factory(search_mode=SearchMode.SIMPLE)
         params = client._get_search_params("test")
 
         assert params["st"] == "11"
@@ -94,80 +126,60 @@ class TestNaverDictClient:
         assert params["r_format"] == "json"
         assert params["r_enc"] == "UTF-8"
 
-    def test_get_search_params_detailed(self):
+    def test_get_search_params_detailed(self, client_factory):
         """상세 모드 검색 파라미터 생성 테스트"""
-        client = NaverDictClient(search_mode=SearchMode.DETAILED)
+        client = client_factory(search_mode=SearchMode.DETAILED)
         params = client._get_search_params("test")
 
         assert params["st"] == "111"
         assert params["r_lt"] == "111"
         assert params["q"] == "test"
 
-    def test_safe_get_nested_valid(self):
+    def test_safe_get_nested_valid(self, client_factory):
         """_safe_get_nested 정상 케이스 테스트"""
-        client = NaverDictClient()
+        client = client_factory()
         data = [["value1", "value2"], ["value3"]]
 
         assert client._safe_get_nested(data, 0, 0) == "value1"
         assert client._safe_get_nested(data, 0, 1) == "value2"
         assert client._safe_get_nested(data, 1, 0) == "value3"
 
-    def test_safe_get_nested_invalid_index(self):
+    def test_safe_get_nested_invalid_index(self, client_factory):
         """_safe_get_nested 잘못된 인덱스 테스트"""
-        client = NaverDictClient()
+        client = client_factory()
         data = [["value1"]]
 
         assert client._safe_get_nested(data, 0, 5) == ""
         assert client._safe_get_nested(data, 5, 0) == ""
 
-    def test_safe_get_nested_invalid_type(self):
+    def test_safe_get_nested_invalid_type(self, client_factory):
         """_safe_get_nested 잘못된 타입 테스트"""
-        client = NaverDictClient()
+        client = client_factory()
         data = [["value1"], "not_a_list"]
 
         assert client._safe_get_nested(data, 1, 0) == ""
 
-    def test_get_referer_hanja(self):
-        """한자 사전 Referer 헤더 테스트"""
-        client = NaverDictClient(dict_type=DictType.HANJA)
-        assert client._get_referer() == "https://hanja.dict.naver.com/"
-
-    def test_get_referer_korean(self):
-        """국어 사전 Referer 헤더 테스트"""
-        client = NaverDictClient(dict_type=DictType.KOREAN)
-        assert client._get_referer() == "https://ko.dict.naver.com/"
-
-    def test_get_referer_english(self):
-        """영어 사전 Referer 헤더 테스트"""
-        client = NaverDictClient(dict_type=DictType.ENGLISH)
-        assert client._get_referer() == "https://en.dict.naver.com/"
-
-    def test_get_referer_default(self):
-        """기본 Referer 헤더 테스트"""
-        client = NaverDictClient(dict_type=DictType.GERMAN)
-        assert client._get_referer() == "https://dict.naver.com/"
-
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_success_hanja(self, mock_get):
+    @pytest.mark.parametrize(
+        ("dict_type", "expected"),
+        [
+            (DictType.HANJA, "https://hanja.dict.naver.com/"),
+            (DictType.KOREAN, "https://ko.dict.naver.com/"),
+            (DictType.ENGLISH, "https://en.dict.naver.com/"),
+            (DictType.JAPANESE, "https://ja.dict.naver.com/"),
+            (DictType.CHINESE, "https://zh.dict.naver.com/"),
+            (DictType.GERMAN, "https://dict.naver.com/"),  # 매핑 없는 타입은 기본값
+        ],
+    )
+    def test_get_referer(self, client_factory, dict_type, expected):
+        """사전 타입별 Referer 헤더 테스트"""
+        client = client_factory(dict_type=dict_type)
+        assert client._get_referer() == expected
+
+    def test_search_success_hanja(self, mock_api, client_factory):
         """한자 검색 성공 테스트"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "items": [
-                [
-                    [
-                        ["偀"],
-                        ["꽃부리 영"],
-                        [""],
-                        ["꽃부리", "꾸미개", "싹"],
-                        ["8c1bd80ffc8042c183e823b2171b1333"],
-                        ["ccko"],
-                    ]
-                ]
-            ]
-        }
-        mock_get.return_value = mock_response
-
-        client = NaverDictClient(dict_type=DictType.HANJA)
+        mock_api.return_value.json.return_value = _HANJA_RESPONSE
+
+        client = client_factory(dict_type=DictType.HANJA)
         entry = client.search("偀")
 
         assert entry is not None
@@ -177,27 +189,11 @@ class TestNaverDictClient:
         assert entry.entry_id == "8c1bd80ffc8042c183e823b2171b1333"
         assert entry.dict_type == "ccko"
 
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_success_english(self, mock_get):
+    def test_search_success_english(self, mock_api, client_factory):
         """영어 검색 성공 테스트 (의미 인덱스가 다름)"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "items": [
-                [
-                    [
-                        ["hello"],
-                        ["həˈloʊ"],
-                        ["안녕", "여보세요"],
-                        [],
-                        ["test_id"],
-                        ["enko"],
-                    ]
-                ]
-            ]
-        }
-        mock_get.return_value = mock_response
-
-        client = NaverDictClient(dict_type=DictType.ENGLISH)
+        mock_api.return_value.json.return_value = _ENGLISH_RESPONSE
+
+        client = client_factory(dict_type=DictType.ENGLISH)
         entry = client.search("hello")
 
         assert entry is not None
@@ -205,99 +201,73 @@ class TestNaverDictClient:
         assert entry.reading == "həˈloʊ"
         assert entry.meanings == ["안녕", "여보세요"]
 
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_no_results(self, mock_get):
+    def test_search_no_results(self, mock_api, client_factory):
         """검색 결과 없음 테스트"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"items": [[]]}
-        mock_get.return_value = mock_response
+        mock_api.return_value.json.return_value = {"items": [[]]}
 
-        client = NaverDictClient()
+        client = client_factory()
         entry = client.search("nonexistent")
 
         assert entry is None
 
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_empty_items(self, mock_get):
+    def test_search_empty_items(self, mock_api, client_factory):
         """빈 items 테스트"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"items": []}
-        mock_get.return_value = mock_response
+        mock_api.return_value.json.return_value = {"items": []}
 
-        client = NaverDictClient()
+        client = client_factory()
         entry = client.search("test")
 
         assert entry is None
 
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_network_error(self, mock_get):
+    def test_search_network_error(self, mock_api, client_factory):
         """네트워크 에러 테스트"""
-        from curl_cffi.requests import RequestsError
-
-        mock_get.side_effect = RequestsError("Network error")
+        mock_api.side_effect = RequestsError("Network error")
 
-        client = NaverDictClient()
+        client = client_factory()
         with pytest.raises(NetworkError, match="Failed to fetch data"):
             client.search("test")
 
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_json_decode_error(self, mock_get):
+    def test_search_json_decode_error(self, mock_api, client_factory):
         """JSON 디코딩 에러 테스트"""
-        mock_response = MagicMock()
-        mock_response.json.side_effect = json.JSONDecodeError("Invalid JSON", "", 0)
-        mock_get.return_value = mock_response
+        mock_api.return_value.json.side_effect = json.JSONDecodeError(
+            "Invalid JSON", "", 0
+        )
 
-        client = NaverDictClient()
+        client = client_factory()
         with pytest.raises(ParseError, match="Failed to parse JSON response"):
             client.search("test")
 
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_invalid_response_no_items(self, mock_get):
-        """items 필드 없는 응답 테스트"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"query": "test"}
-        mock_get.return_value = mock_response
-
-        client = NaverDictClient()
-        with pytest.raises(InvalidResponseError, match="missing 'items' field"):
+    @pytest.mark.parametrize(
+        ("json_value", "match"),
+        [
+            pytest.param({"query": "test"}, "missing 'items' field", id="no_items"),
+            pytest.param(["not", "a", "dict"], "missing 'items' field", id="not_dict"),
+            pytest.param(
+                {"items": [["not_a_valid_item"]]},
+                "Invalid item structure",
+                id="invalid_item",
+            ),
+        ],
+    )
+    def test_search_invalid_response(self, mock_api, client_factory, json_value, match):
+        """올바르지 않은 응답 구조 테스트"""
+        mock_api.return_value.json.return_value = json_value
+
+        client = client_factory()
+        with pytest.raises(InvalidResponseError, match=match):
             client.search("test")
 
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_invalid_response_not_dict(self, mock_get):
-        """딕셔너리가 아닌 응답 테스트"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = ["not", "a", "dict"]
-        mock_get.return_value = mock_response
-
-        client = NaverDictClient()
-        with pytest.raises(InvalidResponseError, match="missing 'items' field"):
-            client.search("test")
-
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_invalid_item_structure(self, mock_get):
-        """잘못된 item 구조 테스트"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"items": [["not_a_valid_item"]]}
-        mock_get.return_value = mock_response
-
-        client = NaverDictClient()
-        with pytest.raises(InvalidResponseError, match="Invalid item structure"):
-            client.search("test")
-
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_calls_api_with_correct_params(self, mock_get):
+    def test_search_calls_api_with_correct_params(self, mock_api, client_factory):
         """API 호출 시 올바른 파라미터 전달 테스트"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {"items": []}
-        mock_get.return_value = mock_response
+        mock_api.return_value.json.return_value = {"items": []}
 
-        client = NaverDictClient(
+        client = client_factory(
             dict_type=DictType.KOREAN, search_mode=SearchMode.DETAILED
         )
         client.search("안녕")
 
-        mock_get.assert_called_once()
-        call_args = mock_get.call_args
+        mock_api.assert_called_once()
+        call_args = mock_api.call_args
 
         assert call_args[0][0] == "https://ac-dict.naver.com/koko/ac"
         assert call_args[1]["params"]["q"] == "안녕"
@@ -309,25 +279,9 @@ class TestNaverDictClient:
 class TestSearchDict:
     """search_dict 함수 테스트"""
 
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_dict_default(self, mock_get):
+    def test_search_dict_default(self, mock_api):
         """search_dict 기본 파라미터 테스트"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "items": [
-                [
-                    [
-                        ["偀"],
-                        ["꽃부리 영"],
-                        [""],
-                        ["꽃부리"],
-                        ["test_id"],
-                        ["ccko"],
-                    ]
-                ]
-            ]
-        }
-        mock_get.return_value = mock_response
+        mock_api.return_value.json.return_value = _HANJA_RESPONSE
 
         entry = search_dict("偀")
 
@@ -335,25 +289,9 @@ class TestSearchDict:
         assert entry.word == "偀"
         assert entry.dict_type == "ccko"
 
-    @patch("naver_dict_api.client.requests.get")
-    def test_search_dict_custom_params(self, mock_get):
+    def test_search_dict_custom_params(self, mock_api):
         """search_dict 커스텀 파라미터 테스트"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "items": [
-                [
-                    [
-                        ["hello"],
-                        ["həˈloʊ"],
-                        ["안녕"],
-                        [],
-                        ["test_id"],
-                        ["enko"],
-                    ]
-                ]
-            ]
-        }
-        mock_get.return_value = mock_response
+        mock_api.return_value.json.return_value = _ENGLISH_RESPONSE
 
         entry = search_dict(
             "hello",
@@ -365,7 +303,7 @@ class TestSearchDict:
         assert entry is not None
         assert entry.word == "hello"
 
-        call_args = mock_get.call_args
+        call_args = mock_api.call_args
         assert call_args[0][0] == "https://ac-dict.naver.com/enko/ac"
         assert call_args[1]["params"]["st"] == "111"
 
@@ -373,41 +311,52 @@ class TestSearchDict:
 class TestDictType:
     """DictType Enum 테스트"""
 
-    def test_dict_type_values(self):
+    @pytest.mark.parametrize(
+        ("dict_type", "expected"),
+        [
+            (DictType.HANJA, "ccko"),
+            (DictType.KOREAN, "koko"),
+            (DictType.ENGLISH, "enko"),
+            (DictType.JAPANESE, "jako"),
+            (DictType.CHINESE, "zhko"),
+            (DictType.GERMAN, "deko"),
+            (DictType.FRENCH, "frko"),
+            (DictType.SPANISH, "esko"),
+            (DictType.RUSSIAN, "ruko"),
+            (DictType.VIETNAMESE, "viko"),
+            (DictType.ITALIAN, "itko"),
+            (DictType.THAI, "thko"),
+            (DictType.INDONESIAN, "idko"),
+            (DictType.UZBEK, "uzko"),
+        ],
+    )
+    def test_dict_type_values(self, dict_type, expected):
         """DictType 값 테스트"""
-        assert DictType.HANJA.value == "ccko"
-        assert DictType.KOREAN.value == "koko"
-        assert DictType.ENGLISH.value == "enko"
-        assert DictType.JAPANESE.value == "jako"
-        assert DictType.CHINESE.value == "zhko"
-        assert DictType.GERMAN.value == "deko"
-        assert DictType.FRENCH.value == "frko"
-        assert DictType.SPANISH.value == "esko"
-        assert DictType.RUSSIAN.value == "ruko"
-        assert DictType.VIETNAMESE.value == "viko"
-        assert DictType.ITALIAN.value == "itko"
-        assert DictType.THAI.value == "thko"
-        assert DictType.INDONESIAN.value == "idko"
-        assert DictType.UZBEK.value == "uzko"
+        assert dict_type.value == expected
 
 
 class TestSearchMode:
     """SearchMode Enum 테스트"""
 
-    def test_search_mode_values(self):
+    @pytest.mark.parametrize(
+        ("search_mode", "expected"),
+        [
+            (SearchMode.SIMPLE, "simple"),
+            (SearchMode.DETAILED, "detailed"),
+        ],
+    )
+    def test_search_mode_values(self, search_mode, expected):
         """SearchMode 값 테스트"""
-        assert SearchMode.SIMPLE.value == "simple"
-        assert SearchMode.DETAILED.value == "detailed"
+        assert search_mode.value == expected
 
 
 @pytest.mark.integration
 class TestIntegration:
     """실제 API 통합 테스트"""
 
-    def test_search_hanja_real(self):
+    def test_search_hanja_real(self, hanja_client):
         """실제 한자 검색 통합 테스트"""
-        client = NaverDictClient(dict_type=DictType.HANJA)
-        entry = client.search("偀")
+        entry = hanja_client.search("偀")
 
         assert entry is not None
         assert entry.word == "偀"
@@ -423,26 +372,23 @@ class TestIntegration:
         assert "안녕" in entry.word
         assert len(entry.meanings) > 0
 
-    def test_search_english_real(self):
+    def test_search_english_real(self, english_client):
         """실제 영어 검색 통합 테스트"""
-        entry = search_dict("hello", dict_type=DictType.ENGLISH)
+        entry = english_client.search("hello")
 
         assert entry is not None
         assert "hello" in entry.word.lower()
         assert len(entry.meanings) > 0
 
-    def test_search_nonexistent_real(self):
+    def test_search_nonexistent_real(self, hanja_client):
         """존재하지 않는 단어 검색 통합 테스트"""
-        entry = search_dict("xyzabc123nonexistent", dict_type=DictType.HANJA)
+        entry = hanja_client.search("xyzabc123nonexistent")
 
         assert entry is None
 
-    def test_search_detailed_mode_real(self):
+    def test_search_detailed_mode_real(self, hanja_detailed_client):
         """상세 모드 검색 통합 테스트"""
-        client = NaverDictClient(
-            dict_type=DictType.HANJA, search_mode=SearchMode.DETAILED
-        )
-        entry = client.search("前")
+        entry = hanja_detailed_client.search("前")
 
         assert entry is not None
         assert entry.word == "前"